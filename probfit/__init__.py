@@ -6,8 +6,8 @@ probfit - Cost function builder. For fitting distributions.
 """
 
 
-from .costfunc import UnbinnedLH, BinnedLH, Chi2Regression, BinnedChi2,\
- SimultaneousFit
+from .costfunc import UnbinnedLH, GaussianUnbinnedLH, BinnedLH, Chi2Regression,\
+ BinnedChi2, SimultaneousFit
 from .pdf import doublegaussian, doublecrystalball, ugaussian, gaussian, crystalball, \
     argus, cruijff, linear, poly2, poly3, novosibirsk, \
     Polynomial, HistogramPdf, cauchy, rtv_breitwigner, johnsonSU
@@ -33,6 +33,7 @@ __all__ = [
     'Chi2Regression',
     'Convolve',
     'Extended',
+    'GaussianUnbinnedLH',
     'Normalized',
     'Polynomial',
     'HistogramPdf',
@@ -14,6 +14,9 @@ cpdef double integrate1d(f, tuple bound, int nint, tuple arg=*) except *
 
 cpdef double integrate1d_with_edges(f,np.ndarray edges, double bw, tuple arg) except *
 
+cpdef np.ndarray[np.double_t] integrate1d_bins(f, np.ndarray[np.double_t] edges,
+                                               int nint_subdiv, tuple arg)
+
 #these are performance critical code
 cpdef double compute_bin_lh_f(f,
                     np.ndarray[np.double_t] edges,
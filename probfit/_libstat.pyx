@@ -1,7 +1,7 @@
 #cython: embedsignature=True
 import numpy as np
 cimport numpy as np
-from libc.math cimport exp, pow, fabs, log, tgamma, lgamma, sqrt
+from libc.math cimport exp, pow, fabs, fmax, log, tgamma, lgamma, sqrt
 include "log1p_patch.pxi"
 from warnings import warn
 from .probfit_warnings import LogWarning
@@ -47,6 +47,29 @@ cdef double simpson38(f, np.ndarray edges, double bw, tuple arg):
     return bw/8.*( csum(yedges)*2.+csum(left38+right38)*3. - (yedges[0]+yedges[-1]) ) #simpson3/8
 
 
+#simpson 3/8 nodes and weights on [0, 1] for a given nint. A fit keeps
+#asking for the same nint so these are kept around and mapped onto the
+#bound at call time instead of rebuilt every call
+cdef dict _simpson38_grids = {}
+
+cdef tuple _simpson38_unit_grid(int nint):
+    grid = _simpson38_grids.get(nint)
+    if grid is not None:
+        return grid
+    cdef np.ndarray[np.double_t] edges = np.linspace(0., 1., nint+1)
+    cdef double bw = 1./nint
+    cdef np.ndarray[np.double_t] u = np.concatenate(
+        [edges, (2.*edges[1:]+edges[:-1])/3., (edges[1:]+2.*edges[:-1])/3.])
+    cdef np.ndarray[np.double_t] w = np.empty(len(u))
+    w[:nint+1] = 2.*bw/8.
+    w[0] = bw/8.
+    w[nint] = bw/8.
+    w[nint+1:] = 3.*bw/8.
+    grid = (u, w)
+    _simpson38_grids[nint] = grid
+    return grid
+
+
 #TODO: do something smarter like dynamic edge based on derivative or so
 cpdef double integrate1d(f, tuple bound, int nint, tuple arg=None) except*:
     """
@@ -55,36 +78,85 @@ cpdef double integrate1d(f, tuple bound, int nint, tuple arg=None) except*:
     if arg is None: arg = tuple()
     if has_ana_integral(f):
         return f.integrate(bound, nint, *arg)
+    cdef int i
     cdef double ret = 0
-    cdef np.ndarray[np.double_t] edges = np.linspace(bound[0], bound[1], nint+1)
-    #cdef np.ndarray[np.double_t] bw = edges[1:]-edges[:-1]
-    cdef double bw = edges[1]-edges[0]
-    return simpson38(f, edges, bw, arg)
+    cdef double a = bound[0]
+    cdef double b = bound[1]
+    cdef np.ndarray[np.double_t] u
+    cdef np.ndarray[np.double_t] w
+    u, w = _simpson38_unit_grid(nint)
+    cdef np.ndarray[np.double_t] y = _vector_apply(f, a+(b-a)*u, arg)
+    for i in range(len(u)):
+        ret += w[i]*y[i]
+    return (b-a)*ret
+
+
+#integral of f over every bin. Without analytic integral, simpson3/8 is done
+#on nint_subdiv pieces per bin but f is evaluated for all bins in one sweep
+cpdef np.ndarray[np.double_t] integrate1d_bins(f, np.ndarray[np.double_t] edges,
+                                               int nint_subdiv, tuple arg):
+    cdef int i, j, k
+    cdef int nbins = len(edges)-1
+    cdef int npiece = nbins*nint_subdiv
+    cdef double lo, sbw
+    cdef np.ndarray[np.double_t] ret = np.zeros(nbins)
+    if has_ana_integral(f):
+        for i in range(nbins):
+            ret[i] = f.integrate((edges[i],edges[i+1]), nint_subdiv, *arg)
+        return ret
+    cdef np.ndarray[np.double_t] x = np.empty(npiece+1)
+    cdef np.ndarray[np.double_t] xleft38 = np.empty(npiece)
+    cdef np.ndarray[np.double_t] xright38 = np.empty(npiece)
+    for i in range(nbins):
+        lo = edges[i]
+        sbw = (edges[i+1]-lo)/nint_subdiv
+        for j in range(nint_subdiv):
+            x[i*nint_subdiv+j] = lo+j*sbw
+    x[npiece] = edges[nbins]
+    for k in range(npiece):
+        xleft38[k] = (2.*x[k+1]+x[k])/3.
+        xright38[k] = (x[k+1]+2.*x[k])/3.
+    cdef np.ndarray[np.double_t] y = _vector_apply(f, x, arg)
+    cdef np.ndarray[np.double_t] yleft38 = _vector_apply(f, xleft38, arg)
+    cdef np.ndarray[np.double_t] yright38 = _vector_apply(f, xright38, arg)
+    for i in range(nbins):
+        for j in range(nint_subdiv):
+            k = i*nint_subdiv+j
+            ret[i] += (x[k+1]-x[k])/8.*(y[k]+y[k+1]+3.*(yleft38[k]+yright38[k]))
+    return ret
 
 
 #compute x*log(y/x) to a good precision especially when y~x
 cpdef double xlogyx(double x,double y):
-    cdef double ret
     if x<1e-100:
         warn(LogWarning('x is really small return 0'))
-        return 0.
-    if x<y:
-        ret = x*log1p((y-x)/x)
-    else:
-        ret = -x*log1p((x-y)/y)
-    return ret
+    return _xlogyx(x, y)
 
 
 #compute w*log(y/x) where w < x and goes to zero faster than x
 cpdef double wlogyx(double w,double y, double x):
     if x<1e-100:
         warn(LogWarning('x is really small return 0'))
+    return _wlogyx(w, y, x)
+
+
+#silent versions for the likelihood loops where empty bins are expected
+cdef inline double _xlogyx(double x, double y):
+    if x<1e-100:
         return 0.
     if x<y:
-        ret = w*log1p((y-x)/x)
+        return x*log1p((y-x)/x)
     else:
-        ret = -w*log1p((x-y)/y)
-    return ret
+        return -x*log1p((x-y)/y)
+
+
+cdef inline double _wlogyx(double w, double y, double x):
+    if x<1e-100:
+        return 0.
+    if x<y:
+        return w*log1p((y-x)/x)
+    else:
+        return -w*log1p((x-y)/y)
 
 #these are performance critical code
 cpdef double compute_bin_lh_f(f,
@@ -114,20 +186,26 @@ cpdef double compute_bin_lh_f(f,
     cdef int n = len(edges)
 
     cdef double ret = 0.
+    cdef double comp = 0. #kahan compensation
+    cdef double term = 0.
+    cdef double t = 0.
     cdef double bw = 0.
     
     cdef double factor=0.
     cdef double th=0.
     cdef double tw=0.
     cdef double tm=0.
+    cdef np.ndarray[np.double_t] expected = integrate1d_bins(f, edges,
+                                                             nint_subdiv, arg)
     for i in range(n-1):#h has length of n-1
         #ret -= h[i]*log(midvalues[i])#non zero subtraction
         bw = edges[i+1]-edges[i]
         th = h[i]
-        tm = integrate1d(f, (edges[i],edges[i+1]), nint_subdiv, arg)
+        #truncate so an empty model bin gives a large but finite penalty
+        tm = fmax(expected[i], 1e-300)
         if not extend:
             if not use_sumw2:
-                ret -= xlogyx(th,tm*N)+(th-tm*N)
+                term = -(_xlogyx(th,tm*N)+(th-tm*N))
                 #h[i]*log(midvalues[i]/nh[i]) #subtracting h[i]*log(h[i]/(N*bw))
                 #the second term is added for added precision near the minimum
             else:
@@ -135,17 +213,22 @@ cpdef double compute_bin_lh_f(f,
                 tw = w2[i]
                 #tw = sqrt(tw)
                 factor = th/tw
-                ret -= factor*(wlogyx(th,tm*N,th)+(th-tm*N))
+                term = -factor*(_wlogyx(th,tm*N,th)+(th-tm*N))
         else:
             #print 'h',h[i],'midvalues',midvalues[i]*bw
             if not use_sumw2:
-                ret -= xlogyx(th,tm)+(th-tm)
+                term = -(_xlogyx(th,tm)+(th-tm))
             else:
                 if w2[i]<1e-200: continue
                 tw = w2[i]
                 #tw = sqrt(tw)
                 factor = th/tw
-                ret -= factor*(wlogyx(th,tm,th)+(th-tm))
+                term = -factor*(_wlogyx(th,tm,th)+(th-tm))
+        #compensated summation; the terms are tiny near the minimum
+        term -= comp
+        t = ret + term
+        comp = (t - ret) - term
+        ret = t
 
     return ret
 
@@ -155,6 +238,9 @@ cpdef double compute_nll(f,np.ndarray data,w,arg,double badvalue) except *:
     cdef double lh=0
     cdef double nll=0
     cdef double ret=0
+    cdef double comp=0 #kahan compensation
+    cdef double term=0
+    cdef double t=0
     cdef double thisdata=0
     cdef np.ndarray[np.double_t] data_ = data
     cdef int data_len = len(data)
@@ -167,7 +253,10 @@ cpdef double compute_nll(f,np.ndarray data,w,arg,double badvalue) except *:
                 ret = badvalue
                 break
             else:
-                ret+=log(lh)
+                term = log(lh) - comp
+                t = ret + term
+                comp = (t - ret) - term
+                ret = t
     else:
         w_ = w
         for i in range(data_len):
@@ -177,7 +266,10 @@ cpdef double compute_nll(f,np.ndarray data,w,arg,double badvalue) except *:
                 ret = badvalue
                 break
             else:
-                ret+=log(lh)*w_[i]
+                term = log(lh)*w_[i] - comp
+                t = ret + term
+                comp = (t - ret) - term
+                ret = t
     return -1*ret
 
 
@@ -226,9 +318,11 @@ cpdef double compute_bin_chi2_f(f,
     cdef double ret = 0.
     cdef double err
     cdef double bw
+    cdef np.ndarray[np.double_t] expected = integrate1d_bins(f, edges,
+                                                             nint_subdiv, arg)
 
     for i in range(datalen):
-        fx = integrate1d(f, (edges[i],edges[i+1]), nint_subdiv, arg)
+        fx = expected[i]
         diff = fx-y[i]
         if usee==1:
             err = error[i]
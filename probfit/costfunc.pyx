@@ -8,11 +8,15 @@ from ._libstat cimport compute_nll, compute_chi2_f, compute_bin_chi2_f, \
     csum, compute_bin_lh_f, integrate1d
 from .funcutil import FakeFuncCode, merge_func_code
 from .nputil import float2double, mid, minmax
-from .functor cimport construct_arg
+from .functor cimport construct_arg, fast_tuple_equal
+from .pdf import gaussian
 from .util import describe, remove_prefix
 
 np.import_array()
 
+cdef double pi = 3.14159265358979323846264338327
+cdef double smallestdiv = 1e-10
+
 cdef extern from "math.h":
     bint isnan(double x)
 
@@ -38,7 +42,9 @@ cdef class SimultaneousFit:
     cdef readonly object func_defaults
     cdef np.ndarray factors
     cdef readonly object prefix
-    #FIXME: cache each part if called with same parameter
+    cdef list argcache
+    cdef double[:] cache
+    cdef public int hit
     def __init__(self, *arg, factors=None, prefix=None, skip_prefix=None):
         self.allf = list(arg)
         func_code, allpos = merge_func_code(*arg, prefix=prefix,
@@ -51,15 +57,28 @@ cdef class SimultaneousFit:
             factors = np.array([1.] * len(arg))
         self.prefix = prefix
         self.factors = factors
+        self.argcache = [None] * self.numf
+        self.cache = np.zeros(self.numf)
+        self.hit = 0
 
     def __call__(self, *arg):
         cdef double ret = 0.
-        cdef np.ndarray[np.int_t] pos
+        cdef double tmp = 0.
+        cdef int i
         cdef tuple thisarg
         for i in range(self.numf):
-            pos = self.allpos[i]
-            thisarg = construct_arg(arg, pos)
-            ret += self.factors[i] * self.allf[i](*thisarg)
+            thisarg = construct_arg(arg, self.allpos[i])
+            # minimizer usually moves one parameter at a time; cost functions
+            # that don't depend on it don't need to be recomputed
+            if self.argcache[i] is not None and \
+                    fast_tuple_equal(thisarg, self.argcache[i], 0):
+                tmp = self.cache[i]
+                self.hit += 1
+            else:
+                tmp = self.allf[i](*thisarg)
+                self.argcache[i] = thisarg
+                self.cache[i] = tmp
+            ret += self.factors[i] * tmp
         return ret
 
     def args_and_error_for(self, findex, minuit=None, args=None, errors=None):
@@ -329,6 +348,78 @@ cdef class UnbinnedLH:
         plt.show()
         return ret
 
+
+cdef class GaussianUnbinnedLH(UnbinnedLH):
+    cdef readonly double sumw
+    cdef readonly double wmean
+    cdef readonly double wm2
+    def __init__(self, data, weights=None):
+        """
+        :class:`UnbinnedLH` specialized for :func:`probfit.pdf.gaussian`.
+
+        The -log(likelihood) of a gaussian only depends on the data through
+        the sum of weights, the weighted mean and the weighted sum of squared
+        deviations from it. Those are computed once here so each call and
+        each gradient evaluation costs a few floating point operations
+        regardless of the size of the data. It also provides the analytic
+        gradient so that Minuit doesn't need to estimate it numerically::
+
+            lh = GaussianUnbinnedLH(data)
+            minuit = iminuit.Minuit(lh, grad=lh.grad, mean=0., sigma=1.,
+                                    error_mean=0.1, error_sigma=0.1)
+
+        Give reasonable initial errors when using **grad**. Minuit doesn't
+        estimate the second derivatives when the gradient is given so its
+        first step is only as good as the initial errors.
+
+        **Arguments**
+
+            - **data** 1D array of data.
+            - **weights** Optional 1D array of weights. Default None(all 1).
+
+        .. note::
+            Since nothing is computed by taking log of the pdf, the value
+            stays finite far away from the minimum where
+            ``UnbinnedLH(gaussian, data)`` would underflow and return
+            its **badvalue**. There is no **badvalue** argument for that
+            reason.
+        """
+        UnbinnedLH.__init__(self, gaussian, data, weights=weights)
+        #deviations are taken from the mean to avoid cancellation in
+        #sum(x^2) - 2*mean*sum(x) + N*mean^2
+        if weights is None:
+            self.sumw = self.data_len
+            self.wmean = np.mean(self.data)
+            self.wm2 = np.sum((self.data-self.wmean)**2)
+        else:
+            w = float2double(np.asarray(weights))
+            self.sumw = np.sum(w)
+            self.wmean = np.sum(w*self.data)/self.sumw
+            self.wm2 = np.sum(w*(self.data-self.wmean)**2)
+
+    def __call__(self, double mean, double sigma):
+        """
+        Compute sum of -log(lh) for given **mean** and **sigma**.
+        """
+        cdef double d = self.wmean-mean
+        cdef double s2 = self.wm2 + self.sumw*d*d #sum w*(x-mean)^2
+        self.last_arg = (mean, sigma)
+        if sigma < smallestdiv:#what gaussian does
+            return -self.sumw*log(1e-300)
+        return 0.5*s2/(sigma*sigma) + self.sumw*(log(sigma) + 0.5*log(2*pi))
+
+    def grad(self, double mean, double sigma):
+        """
+        Gradient of :meth:`__call__` with respect to (mean, sigma).
+        """
+        cdef double d = self.wmean-mean
+        cdef double s1 = self.sumw*d #sum w*(x-mean)
+        cdef double s2 = self.wm2 + self.sumw*d*d
+        if sigma < smallestdiv:
+            return (0., 0.)
+        return (-s1/(sigma*sigma), self.sumw/sigma - s2/(sigma*sigma*sigma))
+
+
 cdef class BinnedLH:
     cdef readonly object f
     cdef readonly object vf
@@ -467,10 +558,12 @@ cdef class BinnedLH:
             else:
                 self.w2, _ = np.histogram(data, bins, range=bound,
                                           weights=weighterrors * weighterrors)
+            self.w2 = float2double(self.w2)
         else:
-            self.w2, _ = np.histogram(data, bins, range=bound, weights=None)
+            # sum of w^2 is just the count when every weight is 1
+            # no need to histogram the data a second time
+            self.w2 = self.h
 
-        self.w2 = float2double(self.w2)
         self.midpoints = mid(self.edges)
         self.binwidth = np.diff(self.edges)
 
@@ -3,6 +3,7 @@ cimport cython
 from cpython cimport PyFloat_AsDouble, PyTuple_GetItem, PyTuple_GetItem,\
                      PyObject, PyTuple_SetItem, PyTuple_SetItem,\
                      PyTuple_New, Py_INCREF, PyFloat_FromDouble
+from collections import OrderedDict
 import numpy as np
 cimport numpy as np
 from warnings import warn
@@ -269,8 +270,8 @@ cdef class AddPdf:
 
     cdef readonly int numf
 
-    cdef np.ndarray cache
-    cdef np.ndarray factor_cache
+    cdef double[:] cache
+    cdef double[:] factor_cache
     cdef list argcache
     cdef list factor_argcache
 
@@ -575,6 +576,11 @@ cdef class Normalized:
         - **warnfloat** optinal number of times it should warn if integral
           of the given function is really small. This usually indicate
           you bound doesn't make sense with given parameters.
+        - **cachesize** optional number of previously computed normalizations
+          to remember, least recently used ones are dropped first. Minimizers
+          tend to come back to the same parameters (ex: the center point of
+          each gradient estimate) so this saves recomputing the integral.
+          Default 100.
 
     .. note::
         Integration implemented here is just a simple trapezoid rule.
@@ -595,12 +601,15 @@ cdef class Normalized:
 
             totalpdf = Add2PdfNorm(pdf1,pdf2)
 
-        The reason is that Normalized has excatly one cache value. Everytime
-        it's called with different parameters the cache is invalidate and it
-        will recompute the integration which takes a long time. For the
-        example given above, when calling totalpdf, calling to `pdf2` will
-        always invalidate `pdf1` cache causing it to recompute integration
-        for every datapoint `x`. The fix is easy::
+        The reason is that Normalized has exactly one fast cache value.
+        For the example given above, calls to `pdf1` and `pdf2` alternate
+        for every datapoint `x` so each one replaces the other's fast cache
+        value and the normalization has to be looked up in the history
+        instead. That lookup is much slower than the fast cache. If more
+        distinct parameter sets take turns than the history can hold
+        (**cachesize**), it misses as well and the integration is
+        recomputed for every datapoint `x`, which takes a long time.
+        The fix is easy::
 
             #DO THIS INSTEAD
             def f(x,y,z):
@@ -626,10 +635,14 @@ cdef class Normalized:
     cdef int warnfloat
     cdef int floatwarned
     cdef public int hit
-    def __init__(self,f,bound,nint=300,warnfloat=1):
+    cdef object norm_history
+    cdef int cachesize
+    def __init__(self,f,bound,nint=300,warnfloat=1,cachesize=100):
         self.f = f
         self.norm_cache= 1.
         self.last_arg = None
+        self.norm_history = OrderedDict()
+        self.cachesize = cachesize
         self.nint = nint
         # normx = normx if normx is not None else np.linspace(range[0],range[1],nint)
         #         if normx.dtype!=normx.dtype:
@@ -668,8 +681,20 @@ cdef class Normalized:
             pass
         else:
             self.last_arg = targ
-            self.norm_cache = integrate1d_with_edges(self.f, self.edges,
-                                                    self.binwidth, targ)
+            norm = self.norm_history.pop(targ, None)
+            if norm is not None:#seen these parameters before
+                self.hit+=1
+                self.norm_cache = norm
+                #put it back as the most recently used
+                #(OrderedDict.move_to_end is not available on python 2)
+                self.norm_history[targ] = norm
+            else:
+                self.norm_cache = integrate1d_with_edges(self.f, self.edges,
+                                                        self.binwidth, targ)
+                if self.cachesize > 0:
+                    if len(self.norm_history) >= self.cachesize:
+                        self.norm_history.popitem(last=False)#drop the least recently used
+                    self.norm_history[targ] = self.norm_cache
         return self.norm_cache
 
     def integrate(self, tuple bound, int bint, *arg):
@@ -709,12 +734,13 @@ cdef class BlindFunc:
     cdef public func_code
     cdef public func_defaults
     cdef int signflip
-    cdef int [:] argpos
+    cdef int [:] isblind # flag for each argument of f
     cdef double shift
 
     def __init__(self, f, toblind, seedstring, width=1, signflip=True):
-        cdef int i
+        cdef int pos
         self.f = f
+        names = describe(f)
         blindlist=[]
         if np.isscalar(toblind):
             blindlist= [toblind]
@@ -722,9 +748,9 @@ cdef class BlindFunc:
             blindlist= toblind
 
         for tob in blindlist:
-            if tob not in describe(f):
+            if tob not in names:
                 raise ValueError('%s is not in a recognized parameter'%tob)
-        self.argpos = np.empty(len(blindlist), dtype=np.int32)
+        self.isblind = np.zeros(len(names), dtype=np.int32)
         self.func_code = FakeFuncCode(f)
         self.func_defaults = None
 
@@ -737,17 +763,19 @@ cdef class BlindFunc:
 
         self.signflip = myRandom.choice([-1,1])
         self.shift = myRandom.normal(0, width)
-        for i,bb in enumerate(blindlist):
-            self.argpos[i] = describe(f).index(bb)
+        for bb in blindlist:
+            pos = names.index(bb)
+            self.isblind[pos] = 1
 
     cpdef tuple __shift_arg__(self, tuple arg):
         cdef int numarg = len(arg)
+        cdef int nflag = self.isblind.shape[0]
         cdef tuple ret = PyTuple_New(numarg)
         cdef int i
         cdef object tmp, tmp2
         cdef double ftmp
         for i in range(numarg):
-            if not i in self.argpos:
+            if i >= nflag or not self.isblind[i]:
                 tmp =  <object>PyTuple_GetItem(arg, i)
                 Py_INCREF(tmp) # get is borrow and set is steal
                                # but <object> comes with inc ref + dec ref
@@ -3,11 +3,17 @@ import collections
 import numpy as np
 from iminuit import Minuit
 from .py23_compat import range
-from .costfunc import UnbinnedLH, BinnedChi2, BinnedLH
+from .costfunc import UnbinnedLH, GaussianUnbinnedLH, BinnedChi2, BinnedLH
+from .pdf import gaussian
 from ._libstat import _vector_apply
 from .nputil import minmax
 
 
+def _unbinned_lh(f, data):
+    # no per event call to the pdf for gaussian
+    return GaussianUnbinnedLH(data) if f is gaussian else UnbinnedLH(f, data)
+
+
 def fit_uml(f, data, quiet=False, print_level=0, *arg, **kwd):
     """
     perform unbinned likelihood fit
@@ -17,10 +23,14 @@ def fit_uml(f, data, quiet=False, print_level=0, *arg, **kwd):
     :param printlevel: minuit printlevel
     :return:
     """
-    uml = UnbinnedLH(f, data)
+    # grad is not passed since without good initial step sizes MIGRAD
+    # strategy 0 with analytic gradient may take a wild first step
+    uml = _unbinned_lh(f, data)
     minuit = Minuit(uml, print_level=print_level, **kwd)
-    minuit.set_strategy(2)
+    # cheap strategy for the minimization, one hesse at the end for errors
+    minuit.set_strategy(0)
     minuit.migrad()
+    minuit.hesse()
     if not minuit.migrad_ok() or not minuit.matrix_accurate():
         if not quiet:
             from matplotlib import pyplot as plt
@@ -45,8 +55,10 @@ def fit_binx2(f, data, bins=30, bound=None, print_level=0, quiet=False, *arg, **
     """
     uml = BinnedChi2(f, data, bins=bins, bound=bound)
     minuit = Minuit(uml, print_level=print_level, **kwd)
-    minuit.set_strategy(2)
+    # cheap strategy for the minimization, one hesse at the end for errors
+    minuit.set_strategy(0)
     minuit.migrad()
+    minuit.hesse()
     if not minuit.migrad_ok() or not minuit.matrix_accurate():
         if not quiet:
             from matplotlib import pyplot as plt
@@ -80,8 +92,10 @@ def fit_binlh(f, data, bins=30,
     uml = BinnedLH(f, data, bins=bins, bound=bound,
                    weights=weights, use_w2=use_w2, extended=extended)
     minuit = Minuit(uml, print_level=print_level, pedantic=pedantic, **kwd)
-    minuit.set_strategy(2)
+    # cheap strategy for the minimization, one hesse at the end for errors
+    minuit.set_strategy(0)
     minuit.migrad()
+    minuit.hesse()
     if not minuit.migrad_ok() or not minuit.matrix_accurate():
         if not quiet:
             from matplotlib import pyplot as plt
@@ -117,7 +131,7 @@ def pprint_arg(vnames, value):
 
 def try_uml(f, data, bins=40, fbins=1000, *arg, **kwd):
     from matplotlib import pyplot as plt
-    fom = UnbinnedLH(f, data)
+    fom = _unbinned_lh(f, data)
     narg = f.func_code.co_argcount
     vnames = f.func_code.co_varnames[1:narg]
     my_arg = [tuplize(kwd[name]) for name in vnames]
@@ -1,7 +1,7 @@
 #cython: embedsignature=True
 cimport cython
 
-from libc.math cimport exp, pow, fabs, log, sqrt, sinh, tgamma, abs, fabs, cosh, atan2, asinh, erf
+from libc.math cimport exp, pow, fabs, log, sqrt, sinh, tgamma, abs, fabs, cosh, atan2, asinh, erf, erfc, expm1
 cdef double pi = 3.14159265358979323846264338327
 import numpy as np
 cimport numpy as np
@@ -46,27 +46,27 @@ cdef class Polynomial:
     def integrate(self, tuple bound, int nint_subdiv, *arg):
         cdef double a, b
         a, b = bound
-        cdef double ret = 0.
-        for i in range(self.order+1):
-            ai1 = pow(a,i+1)
-            bi1 = pow(b,i+1)
-            ret += 1./(i+1) * arg[i] * (bi1-ai1)
-        return ret
+        cdef double t
+        cdef double reta = 0.
+        cdef double retb = 0.
+        cdef int i
+        #horner on the antiderivative sum c_i x^(i+1)/(i+1)
+        for i in range(self.order, -1, -1):
+            t = arg[i]
+            t /= i+1
+            reta = reta*a + t
+            retb = retb*b + t
+        return retb*b - reta*a
 
     def __call__(self,*arg):
         cdef double x = arg[0]
         cdef double t
         cdef double ret=0.
-        cdef int iarg
-        cdef int numarg = self.order+1 #number of coefficient
         cdef int i
-        for i in range(numarg):
-            iarg = i+1
-            t = arg[iarg]
-            if i > 0:
-                ret+=pow(x,i)*t
-            else:#avoid 0^0
-                ret += t
+        #horner: c_0 + x*(c_1 + x*(c_2 + ...))
+        for i in range(self.order+1, 0, -1):
+            t = arg[i]
+            ret = ret*x + t
         return ret
 
 
@@ -250,15 +250,7 @@ cpdef double ugaussian(double x, double mean, double sigma):
     return ret
 
 
-cpdef double gaussian(double x, double mean, double sigma):
-    """
-    Normalized gaussian.
-
-    .. math::
-        f(x; mean, \sigma) = \\frac{1}{\sqrt{2\pi}\sigma}
-        \exp \left[  -\\frac{1}{2} \left(\\frac{x-mean}{\sigma}\\right)^2 \\right]
-
-    """
+cdef double _gaussian(double x, double mean, double sigma):
     cdef double badvalue = 1e-300
     cdef double ret = 0
     if sigma < smallestdiv:
@@ -270,27 +262,46 @@ cpdef double gaussian(double x, double mean, double sigma):
     return ret
 
 
-cpdef double crystalball(double x, double alpha, double n, double mean, double sigma):
+cdef class _Gaussian:
     """
-    Unnormalized crystal ball function
+    Normalized gaussian.
 
     .. math::
-        f(x;\\alpha,n,mean,\sigma) =
-        \\begin{cases}
-            \exp\left( -\\frac{1}{2} \delta^2 \\right) & \mbox{if } \delta>-\\alpha \\\\
-            \left( \\frac{n}{|\\alpha|} \\right)^n \left( \\frac{n}{|\\alpha|} - |\\alpha| - \delta \\right)^{-n}
-            \exp\left( -\\frac{1}{2}\\alpha^2\\right)
-            & \mbox{if } \delta \leq \\alpha
-        \end{cases}
+        f(x; mean, \sigma) = \\frac{1}{\sqrt{2\pi}\sigma}
+        \exp \left[  -\\frac{1}{2} \left(\\frac{x-mean}{\sigma}\\right)^2 \\right]
 
-    where
+    The integral is computed analytically.
 
-        - :math:`\delta = \\frac{x-mean}{\sigma}`
+    """
+    cdef public object func_code
+    cdef public object func_defaults
 
-    .. note::
-        http://en.wikipedia.org/wiki/Crystal_Ball_function
+    def __init__(self, xname='x'):
+        self.func_code = MinimalFuncCode([xname, 'mean', 'sigma'])
+        self.func_defaults = None
 
-    """
+    def __call__(self, double x, double mean, double sigma):
+        return _gaussian(x, mean, sigma)
+
+    cpdef double integrate(self, tuple bound, int nint_subdiv, double mean,
+                           double sigma):
+        cdef double a, b
+        a, b = bound
+        if sigma < smallestdiv:
+            return 1e-300*(b-a)
+        cdef double d1 = (a-mean)/(sqrt(2.)*sigma)
+        cdef double d2 = (b-mean)/(sqrt(2.)*sigma)
+        #use the tail functions so far off-center bins don't cancel to zero
+        if d1 > 0.:
+            return 0.5*(erfc(d1)-erfc(d2))
+        if d2 < 0.:
+            return 0.5*(erfc(-d2)-erfc(-d1))
+        return 0.5*(erf(d2)-erf(d1))
+
+gaussian = _Gaussian()
+
+
+cdef double _crystalball(double x, double alpha, double n, double mean, double sigma):
     cdef double d = 0.
     cdef double ret = 0
     cdef double A = 0
@@ -312,6 +323,69 @@ cpdef double crystalball(double x, double alpha, double n, double mean, double s
             ret = A*pow(B-d,-n)
     return ret
 
+
+cdef class _CrystalBall:
+    """
+    Unnormalized crystal ball function
+
+    .. math::
+        f(x;\\alpha,n,mean,\sigma) =
+        \\begin{cases}
+            \exp\left( -\\frac{1}{2} \delta^2 \\right) & \mbox{if } \delta>-\\alpha \\\\
+            \left( \\frac{n}{|\\alpha|} \\right)^n \left( \\frac{n}{|\\alpha|} - |\\alpha| - \delta \\right)^{-n}
+            \exp\left( -\\frac{1}{2}\\alpha^2\\right)
+            & \mbox{if } \delta \leq \\alpha
+        \end{cases}
+
+    where
+
+        - :math:`\delta = \\frac{x-mean}{\sigma}`
+
+    The integral is computed analytically.
+
+    .. note::
+        http://en.wikipedia.org/wiki/Crystal_Ball_function
+
+    """
+    cdef public object func_code
+    cdef public object func_defaults
+
+    def __init__(self, xname='x'):
+        self.func_code = MinimalFuncCode([xname, 'alpha', 'n', 'mean', 'sigma'])
+        self.func_defaults = None
+
+    def __call__(self, double x, double alpha, double n, double mean, double sigma):
+        return _crystalball(x, alpha, n, mean, sigma)
+
+    cpdef double integrate(self, tuple bound, int nint_subdiv, double alpha,
+                           double n, double mean, double sigma):
+        cdef double a, b
+        a, b = bound
+        if sigma < smallestdiv or fabs(alpha) < smallestdiv or n < 1.:
+            return badvalue*(b-a)
+        cdef double d1 = (a-mean)/sigma
+        cdef double d2 = (b-mean)/sigma
+        cdef double t = -alpha #gaussian core for d > t, power law tail below
+        cdef double al = fabs(alpha)
+        cdef double A = pow(n/al,n)*exp(-al**2/2.)
+        cdef double B = n/al-al
+        cdef double lo, hi
+        cdef double ret = 0.
+        if d2 > t: #gaussian core
+            lo = d1 if d1 > t else t
+            ret += sqrt(pi/2.)*(erf(d2/sqrt(2.))-erf(lo/sqrt(2.)))
+        if d1 < t: #power law tail
+            hi = d2 if d2 < t else t
+            if n == 1.:
+                ret += A*log((B-d1)/(B-hi))
+            else:
+                #A/(n-1)*((B-hi)^(1-n)-(B-d1)^(1-n)) written with expm1 so it
+                #doesn't cancel for n close to 1
+                ret += A*pow(B-d1,1.-n)*expm1((1.-n)*log((B-hi)/(B-d1)))/(n-1.)
+        return sigma*ret
+
+crystalball = _CrystalBall()
+
 cpdef double doublecrystalball(double x, double alpha, double alpha2, double n, double n2, double mean, double sigma):
     """
     Unnormalized double crystal ball function
@@ -441,7 +515,7 @@ cpdef double poly2(double x, double a, double b, double c):
     .. math::
         f(x;a,b,c) = ax^2+bx+c
     """
-    cdef double ret = a*x*x+b*x+c
+    cdef double ret = (a*x+b)*x+c
     return ret
 
 
@@ -453,9 +527,7 @@ cpdef double poly3(double x, double a, double b, double c, double d):
         f(x; a,b,c,d) =ax^3+bx^2+cx+d
 
     """
-    cdef double x2 = x*x
-    cdef double x3 = x2*x
-    cdef double ret = a*x3+b*x2+c*x+d
+    cdef double ret = ((a*x+b)*x+c)*x+d
     return ret
 
 
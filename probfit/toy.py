@@ -27,13 +27,18 @@ def gen_toyn(f, nsample, ntoy, bound, accuracy=10000, quiet=True, **kwd):
 
 def gen_toy(f, nsample, bound, accuracy=10000, quiet=True, **kwd):
     """
-    generate ntoy
-    :param f:
-    :param nsample:
-    :param ntoy:
-    :param bound:
-    :param accuracy:
-    :param quiet:
+    generate toy sample of size nsample from pdf f.
+
+    All samples are drawn in one batch: f is tabulated once on a grid of
+    ``accuracy`` points, the cumulative distribution is built from it and
+    ``nsample`` uniform random numbers are mapped through its inverse. There
+    is no per-sample accept/reject loop.
+
+    :param f: pdf
+    :param nsample: number of samples
+    :param bound: (min, max) range to generate the samples in
+    :param accuracy: number of grid points used to tabulate the cdf
+    :param quiet: if False print the parameter names and plot the result
     :param kwd: the rest of keyword argument will be passed to f
     :return: numpy.ndarray
     """
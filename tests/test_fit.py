@@ -7,7 +7,7 @@ from iminuit.iminuit_warnings import InitialParamWarning
 from probfit.funcutil import rename
 from probfit.pdf import gaussian, linear
 from probfit.costfunc import UnbinnedLH, BinnedLH, BinnedChi2, Chi2Regression, \
-    SimultaneousFit
+    SimultaneousFit, GaussianUnbinnedLH
 
 
 class TestFit:
@@ -27,6 +27,21 @@ class TestFit:
         minuit = iminuit.Minuit(lh)
         assert_allclose(minuit.errordef, 0.5)
 
+    def test_GaussianUnbinnedLH(self):
+        weights = np.linspace(0.5, 1.5, self.ndata)
+        for w in (None, weights):
+            lh = GaussianUnbinnedLH(self.data, weights=w)
+            ref = UnbinnedLH(gaussian, self.data, weights=w)
+            assert list(describe(lh)) == ['mean', 'sigma']
+            assert_allclose(lh(0, 1), ref(0, 1))
+            assert_allclose(lh(0.3, 1.7), ref(0.3, 1.7))
+            eps = 1e-6
+            numerical = [(lh(0.3 + eps, 1.7) - lh(0.3 - eps, 1.7)) / (2 * eps),
+                         (lh(0.3, 1.7 + eps) - lh(0.3, 1.7 - eps)) / (2 * eps)]
+            assert_allclose(lh.grad(0.3, 1.7), numerical, rtol=1e-5)
+        minuit = iminuit.Minuit(lh)
+        assert_allclose(minuit.errordef, 0.5)
+
     def test_BinnedLH(self):
         # write a better test... this depends on subtraction
         f = gaussian
@@ -37,6 +52,18 @@ class TestFit:
         minuit = iminuit.Minuit(lh)
         assert_allclose(minuit.errordef, 0.5)
 
+    def test_BinnedLH_empty_bins(self):
+        # bins with no data and bins where the model predicts nothing
+        def box(x, a):
+            return a if x < 0. else 0.
+
+        lh = BinnedLH(box, self.data, bins=10, bound=(-5, 5))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ret = lh(0.1)
+        assert np.isfinite(ret)
+        assert ret < lh(0.2)
+
     def test_BinnedChi2(self):
         f = gaussian
         assert list(describe(f)) == ['x', 'mean', 'sigma']
@@ -78,3 +105,17 @@ class TestFit:
         assert_allclose(minuit.values['lmu'], 0., atol=2 * minuit.errors['lmu'])
         assert_allclose(minuit.values['rmu'], 3., atol=2 * minuit.errors['rmu'])
         assert_allclose(minuit.values['sigma'], 1., atol=2 * minuit.errors['sigma'])
+
+    def test_simultaneous_cache(self):
+        g1 = rename(gaussian, ['x', 'lmu', 'sigma'])
+        g2 = rename(gaussian, ['x', 'rmu', 'sigma'])
+        ulh1 = UnbinnedLH(g1, self.data)
+        ulh2 = UnbinnedLH(g2, self.data + 3.)
+        sim = SimultaneousFit(ulh1, ulh2)
+        assert_allclose(sim(0., 1., 3.), ulh1(0., 1.) + ulh2(3., 1.))
+        assert sim.hit == 0
+        # only rmu changed so ulh1 is not recomputed
+        assert_allclose(sim(0., 1., 2.), ulh1(0., 1.) + ulh2(2., 1.))
+        assert sim.hit == 1
+        assert_allclose(sim(0., 1.5, 2.), ulh1(0., 1.5) + ulh2(2., 1.5))
+        assert sim.hit == 1
@@ -3,7 +3,8 @@ import numpy as np
 from numpy.testing import assert_allclose
 from iminuit import describe
 from probfit import pdf
-from probfit._libstat import xlogyx, wlogyx, csum, integrate1d, _vector_apply
+from probfit._libstat import xlogyx, wlogyx, csum, integrate1d, _vector_apply, \
+    integrate1d_bins, compute_nll
 from probfit.functor import construct_arg, fast_tuple_equal
 from probfit.funcutil import merge_func_code
 
@@ -57,6 +58,21 @@ def test_gaussian():
     assert_allclose(pdf.gaussian(1, 0, 1), 0.24197072451914337)
 
 
+def test_gaussian_integrate():
+    g = pdf.gaussian
+    assert hasattr(g, 'integrate')
+    f = lambda x, mean, sigma: g(x, mean, sigma)
+    for bound in [(-5., 15.), (0., 7.), (9., 12.)]:
+        for arg in [(10., 2.), (1., 0.5), (-3., 4.)]:
+            numerical = integrate1d(f, bound, 10000, arg)
+            assert_allclose(g.integrate(bound, 0, *arg), numerical)
+    # far tail keeps its relative precision
+    assert_allclose(g.integrate((10., 11.), 0, 0., 1.), 7.619661958203143e-24)
+    assert_allclose(g.integrate((-11., -10.), 0, 0., 1.), 7.619661958203143e-24)
+    assert_allclose(g.integrate((-9., -8.), 0, 0., 1.),
+                    g.integrate((8., 9.), 0, 0., 1.))
+
+
 # cpdef double crystalball(double x,double alpha,double n,double mean,double sigma)
 def test_crystalball():
     assert describe(pdf.crystalball) == ['x', 'alpha', 'n', 'mean', 'sigma']
@@ -66,6 +82,25 @@ def test_crystalball():
     assert_allclose(pdf.crystalball(14, 1, 2, 10, 2), 0.1353352832366127)
     assert_allclose(pdf.crystalball(6, 1, 2, 10, 2), 0.26956918209450376)
 
+
+def test_crystalball_integrate():
+    cb = pdf.crystalball
+    assert hasattr(cb, 'integrate')
+    f = lambda x, alpha, n, mean, sigma: cb(x, alpha, n, mean, sigma)
+    for bound in [(-5., 15.), (0., 7.), (9., 12.)]:
+        for arg in [(1., 2., 10., 2.), (0.5, 1., 10., 1.), (2., 3.5, 9., 0.7)]:
+            numerical = integrate1d(f, bound, 10000, arg)
+            assert_allclose(cb.integrate(bound, 0, *arg), numerical)
+
+
+def test_crystalball_integrate_n_near_1():
+    cb = pdf.crystalball
+    at1 = cb.integrate((-3., 3.), 0, 1.5, 1., 0., 1.)
+    # the true integral only moves by ~1e-11 here
+    for n in [1. + 1e-10, 1. + 1e-9]:
+        assert_allclose(cb.integrate((-3., 3.), 0, 1.5, n, 0., 1.), at1,
+                        rtol=1e-10)
+
 # cpdef double doubecrystalball(double x,double alpha,double alpha2, double n,double n2, double mean,double sigma)
 def test_doublecrystalball():
     assert describe(pdf.doublecrystalball) == ['x', 'alpha', 'alpha2', 'n', 'n2', 'mean', 'sigma']
@@ -137,6 +172,10 @@ def test_polynomial():
     analytical = 8 + 2 / 2. * (10 ** 2 - 2 ** 2) + 3 / 3. * (10 ** 3 - 2 ** 3)
     assert_allclose(integral, analytical)
 
+    p = pdf.Polynomial(0)
+    assert_allclose(p(0, 3), 3)
+    assert_allclose(p.integrate((-1, 2), 1, 3), 9)
+
 
 # cpdef double novosibirsk(double x, double width, double peak, double tail)
 def test_novosibirsk():
@@ -214,6 +253,12 @@ def test_integrate1d():
     analytic = intf(bound[1], y) - intf(bound[0], y)
     assert_allclose(integral, analytic)
 
+    # the grid is reused between calls; make sure bounds don't get mixed up
+    for bound, nint in [((-2., 1.), 10), ((0., 5.), 10), ((-2., 1.), 3)] * 2:
+        integral = integrate1d(f, bound, nint, (y,))
+        analytic = intf(bound[1], y) - intf(bound[0], y)
+        assert_allclose(integral, analytic)
+
 
 def test_integrate1d_analytic():
     class temp:
@@ -230,6 +275,25 @@ def test_integrate1d_analytic():
     assert_allclose(integral, bound[1] - bound[0])
 
 
+def test_integrate1d_bins():
+    def f(x, y):
+        return x * x + y
+
+    edges = np.array([-2., -1.5, 0., 0.2, 1.])
+    for nint in (1, 3):
+        integrals = integrate1d_bins(f, edges, nint, (3.,))
+        expected = [integrate1d(f, (edges[i], edges[i + 1]), nint, (3.,))
+                    for i in range(len(edges) - 1)]
+        assert_allclose(integrals, expected)
+
+
+def test_compute_nll_compensated():
+    # naive summation drops every 1e-16 term against the leading 1
+    w = np.array([1.] + [1e-16] * 1000)
+    nll = compute_nll(lambda x: np.e, np.zeros(len(w)), w, (), -100000.)
+    assert nll == -(1. + 1e-13)
+
+
 def test_csum():
     x = np.array([1, 2, 3], dtype=np.double)
     s = csum(x)
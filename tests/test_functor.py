@@ -52,6 +52,20 @@ def test_Normalized_cache_hit():
     assert ng.hit == 1
 
 
+def test_Normalized_cache_history():
+    nf = Normalized(ugaussian, (-1., 1.), cachesize=2)
+    first = nf(0.5, 0., 1.)
+    nf(0.5, 0., 2.)
+    assert nf.hit == 0
+    assert_almost_equal(nf(0.5, 0., 1.), first)
+    assert nf.hit == 1
+    nf(0.5, 0., 3.)  # pushes (0., 2.) out, (0., 1.) was just used
+    nf(0.5, 0., 1.)
+    assert nf.hit == 2
+    nf(0.5, 0., 2.)
+    assert nf.hit == 2
+
+
 def test_add_pdf():
     def f(x, y, z):
         return x + y + z
@@ -10,16 +10,24 @@ from probfit.oneshot import fit_binlh, fit_binx2, fit_uml
 
 
 class TestOneshot:
-    def setup(self):
-        self.ndata = 20000
+    @classmethod
+    def setup_class(cls):
+        # the fits don't modify the data so it is generated once per class
+        cls.ndata = 20000
         warnings.simplefilter("ignore", InitialParamWarning)
-        np.random.seed(0)
-        self.data = np.random.randn(self.ndata) * 2. + 5.
-        self.wdown = np.empty(self.ndata)
-        self.wdown.fill(0.1)
+        try:
+            rng = np.random.default_rng(0)
+        except AttributeError:  # numpy < 1.17
+            rng = np.random.RandomState(0)
+        cls.data = rng.standard_normal(cls.ndata)
+        cls.data *= 2.
+        cls.data += 5.
+        cls.wdown = np.full(cls.ndata, 0.1)
 
-        self.ndata_small = 2000
-        self.data_small = np.random.randn(self.ndata_small) * 2. + 5.
+        cls.ndata_small = 2000
+        cls.data_small = rng.standard_normal(cls.ndata_small)
+        cls.data_small *= 2.
+        cls.data_small += 5.
 
     def test_binx2(self):
         egauss = Extended(gaussian)
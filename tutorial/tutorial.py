@@ -160,7 +160,8 @@ plt.hist(data, bins=100, histtype='step');
 # Define your PDF / model
 def gauss_pdf(x, mu, sigma):
     """Normalized Gaussian"""
-    return 1 / np.sqrt(2 * np.pi) / sigma * np.exp(-(x - mu) ** 2 / 2. / sigma ** 2)
+    z = (x - mu) / sigma
+    return np.exp(-0.5 * z * z) / (np.sqrt(2 * np.pi) * sigma)
 
 # <codecell>
 
@@ -181,7 +182,7 @@ binned_likelihood.draw(minuit);
 
 minuit.migrad()
 # Like in all binned fit with long zero tail. It will have to do something about the zero bin
-# probfit.BinnedLH does handle them gracefully but will give you a warning;
+# probfit.BinnedLH handles them gracefully: empty bins only contribute their expected count;
 
 # <codecell>
 
@@ -238,7 +239,8 @@ plt.hist(data, bins=100, histtype='step');
 # We will use the same PDF as in the previous example
 def gauss_pdf(x, mu, sigma):
     """Normalized Gaussian"""
-    return 1 / np.sqrt(2 * np.pi) / sigma * np.exp(-(x - mu) **2 / 2. / sigma ** 2)
+    z = (x - mu) / sigma
+    return np.exp(-0.5 * z * z) / (np.sqrt(2 * np.pi) * sigma)
 
 # <codecell>
 
@@ -331,7 +333,46 @@ minuit.draw_mnprofile('mu');
 
 # <markdowncell>
 
+# If the model is fixed, you can go one step further and write the whole negative log likelihood in Cython.
+# UnbinnedLH calls your PDF once per data point through Python; a hand-written cost function loops over the data in compiled code
+# (and can even release the GIL while doing it).
+
+# <codecell>
+
+%%cython
+# -log(likelihood) of a gaussian computed in a single compiled loop over the data
+cimport cython
+from libc.math cimport log, M_PI
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def gauss_nll_cython(double[:] data, double mu, double sigma):
+    cdef double inv2s2 = 0.5 / (sigma * sigma)
+    cdef double logn = 0.5 * log(2 * M_PI) + log(sigma)
+    cdef double s = 0.
+    cdef double d
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(data.shape[0]):
+            d = data[i] - mu
+            s += d * d * inv2s2 + logn
+    return s
+
+# <codecell>
+
+# iminuit only needs a function of the fit parameters,
+# so we can give it the compiled cost function directly.
+# This time we have to set errordef=0.5 ourselves.
+def gauss_nll(mu, sigma):
+    return gauss_nll_cython(data, mu, sigma)
+
+minuit = iminuit.Minuit(gauss_nll, mu=1, sigma=2, errordef=0.5, pedantic=False, print_level=0)
+minuit.migrad()
+minuit.print_fmin()
+
+# <markdowncell>
+
 # But you really don't have to write your own gaussian, there are tons of builtin functions written in Cython for you.
+# They are compiled once when probfit is installed, so unlike the `%%cython` cells above there is no compile step every time the notebook is started.
 
 # <codecell>
 
@@ -353,6 +394,20 @@ minuit = iminuit.Minuit(unbinned_likelihood, sigma=2, pedantic=False)
 minuit.migrad() # yes: amazingly fast
 unbinned_likelihood.draw(minuit, show_errbars='normal') # control how fit is displayed too;
 
+# <markdowncell>
+
+# For the common case of fitting a plain gaussian there is also a prebuilt cost function,
+# `GaussianUnbinnedLH`. It reduces the data to a few sums once, so each call costs
+# the same no matter how many data points you have. It plays the role of the
+# `gauss_nll_cython` function above without the need to compile anything.
+
+# <codecell>
+
+gauss_likelihood = probfit.GaussianUnbinnedLH(data)
+gauss_minuit = iminuit.Minuit(gauss_likelihood, mean=1, sigma=2, pedantic=False, print_level=0)
+gauss_minuit.migrad()
+gauss_minuit.print_fmin()
+
 # <codecell>
 
 # Draw the difference between data and PDF